@@ -0,0 +1,83 @@
+"""Optional numba-compiled kernels for the GUI's hot display path."""
+
+import os
+
+import numpy as np
+
+try:
+    from numba import config as _numba_config, njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None and (
+    _numba_config.DISABLE_JIT or os.environ.get("STEM_DISABLE_NUMBA") == "1"
+):
+    # Interpreted per-pixel loops over a multi-megapixel frame would be
+    # much worse than _show_array's NumPy path, so the opt-out disables
+    # these kernels entirely
+    njit = None
+
+
+if njit is not None:
+
+    # Explicit signatures compile eagerly at import time, so the GUI
+    # thread never pays first-call JIT latency mid-interaction.
+    # Both kernels rely on the ``v == v`` NaN guard, so full fastmath is
+    # off the table: its nnan flag lets LLVM assume NaNs never occur and
+    # fold the guard away. Keep the safe flag subset instead.
+    _FASTMATH = {"contract", "arcp", "nsz", "reassoc"}
+
+    @njit(
+        ["UniTuple(float64, 2)(float32[:, :])", "UniTuple(float64, 2)(float64[:, :])"],
+        parallel=True,
+        fastmath=_FASTMATH,
+        cache=True,
+    )
+    def minmax(arr):
+        """NaN-aware min and max of a 2-D array in a single parallel scan."""
+        h, w = arr.shape
+        mn = np.inf
+        mx = -np.inf
+        for i in prange(h):
+            for j in range(w):
+                v = arr[i, j]
+                if v == v:  # skip NaN
+                    mn = min(mn, v)
+                    mx = max(mx, v)
+        return mn, mx
+
+    @njit(
+        ["void(float32[:, :], uint8[:, :])", "void(float64[:, :], uint8[:, :])"],
+        parallel=True,
+        fastmath=_FASTMATH,
+        cache=True,
+    )
+    def norm_u8(arr, out):
+        """Normalize ``arr`` to 0-255 into ``out`` (NaN maps to 0).
+
+        One parallel min/max scan followed by one parallel write pass —
+        no float temporaries between the source array and the uint8
+        display buffer.
+        """
+        h, w = arr.shape
+        mn, mx = minmax(arr)
+        scale = 255.0 / (mx - mn) if mx > mn else 0.0
+        for i in prange(h):
+            for j in range(w):
+                v = arr[i, j]
+                if v == v:
+                    out[i, j] = np.uint8((v - mn) * scale)
+                else:
+                    out[i, j] = 0
+else:
+    minmax = None
+    norm_u8 = None
+
+
+def warmup() -> None:
+    """Run each kernel once on a tiny array so the on-disk numba cache
+    is loaded (or compiled) before the first real frame arrives."""
+    if norm_u8 is not None:
+        dummy = np.zeros((16, 16), dtype=np.float32)
+        minmax(dummy)
+        norm_u8(dummy, np.empty((16, 16), dtype=np.uint8))
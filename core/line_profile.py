@@ -1,14 +1,51 @@
 """Line profile analysis for displacement and strain data."""
 
+import math
+import os
 from pathlib import Path
 from typing import Optional, Tuple
 
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 from scipy.spatial import cKDTree
 
+# Default for diagnostic PNGs; savefig skips the tight-bbox double render
+DEFAULT_DPI = 150
+
+try:
+    from numba import config as _numba_config, njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None and (
+    _numba_config.DISABLE_JIT or os.environ.get("STEM_DISABLE_NUMBA") == "1"
+):
+    # With JIT off the kernel body runs interpreted, which is far slower
+    # than the cKDTree fallback — treat it like a missing numba
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _idw_kernel(points, values, positions, flat_idx, starts, counts, out):
+        """Inverse-distance-weighted average per sample, parallel over samples."""
+        for i in prange(positions.shape[0]):
+            sw = 0.0
+            sv = 0.0
+            for j in range(counts[i]):
+                k = flat_idx[starts[i] + j]
+                ddx = points[k, 0] - positions[i, 0]
+                ddy = points[k, 1] - positions[i, 1]
+                w = 1.0 / (math.sqrt(ddx * ddx + ddy * ddy) + 1e-10)
+                sw += w
+                sv += w * values[k]
+            if sw > 0.0:
+                out[i] = sv / sw
+else:
+    _idw_kernel = None
+
 
 def compute_line_profile(
     points: np.ndarray,
@@ -17,6 +54,7 @@ def compute_line_profile(
     end: Tuple[float, float],
     num_samples: int = 100,
     search_radius: Optional[float] = None,
+    tree: Optional[cKDTree] = None,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Compute a line profile through scattered data.
@@ -29,6 +67,8 @@ def compute_line_profile(
         num_samples: Number of samples along the line.
         search_radius: Radius for nearest-neighbor averaging. If None, uses
                        1/10 of the line length.
+        tree: Optional pre-built cKDTree over `points`, shared across calls
+              to avoid rebuilding it per profile.
 
     Returns:
         Tuple of (distances, positions, sampled_values):
@@ -49,25 +89,41 @@ def compute_line_profile(
     positions = start + np.outer(t, line_vec)
     distances = t * line_length
 
-    # Build KD-tree for efficient neighbor search
-    tree = cKDTree(points)
+    # Build KD-tree for efficient neighbor search (unless shared by caller)
+    if tree is None:
+        tree = cKDTree(points)
 
     sampled_values = np.zeros(num_samples)
-    for i, pos in enumerate(positions):
-        # Find all points within search_radius
-        indices = tree.query_ball_point(pos, r=search_radius)
-        if len(indices) == 0:
-            # Fall back to nearest neighbor
-            _, idx = tree.query(pos, k=1)
-            sampled_values[i] = values[idx]
-        else:
-            # Distance-weighted average
-            neighbor_points = points[indices]
-            neighbor_values = values[indices]
-            dists = np.linalg.norm(neighbor_points - pos, axis=1)
-            # Inverse distance weighting (avoid division by zero)
-            weights = 1.0 / (dists + 1e-10)
-            sampled_values[i] = np.sum(weights * neighbor_values) / np.sum(weights)
+    if _idw_kernel is not None:
+        # Batched neighbor query + parallel IDW kernel
+        idx_lists = tree.query_ball_point(positions, r=search_radius, workers=-1)
+        counts = np.fromiter(map(len, idx_lists), dtype=np.intp, count=num_samples)
+        nonempty = counts > 0
+        if np.any(nonempty):
+            # Empty lists contribute nothing, so the cumulative offsets stay
+            # valid for the concatenated array
+            flat_idx = np.concatenate([idx_lists[i] for i in np.flatnonzero(nonempty)]).astype(np.intp)
+            starts = np.cumsum(counts) - counts
+            _idw_kernel(
+                np.ascontiguousarray(points, dtype=np.float64),
+                np.ascontiguousarray(values, dtype=np.float64),
+                positions, flat_idx, starts, counts, sampled_values,
+            )
+    else:
+        # Build the whole (sample, point) radius graph as one sparse matrix
+        # and aggregate the IDW sums with bincount — no per-sample Python work
+        tree_samples = cKDTree(positions)
+        coo = tree_samples.sparse_distance_matrix(tree, search_radius, output_type="coo_matrix")
+        # Inverse distance weighting (avoid division by zero)
+        weights = 1.0 / (coo.data + 1e-10)
+        weight_sums = np.bincount(coo.row, weights=weights, minlength=num_samples)
+        value_sums = np.bincount(coo.row, weights=weights * values[coo.col], minlength=num_samples)
+        nonempty = weight_sums > 0
+        sampled_values[nonempty] = value_sums[nonempty] / weight_sums[nonempty]
+    if not np.all(nonempty):
+        # Fall back to nearest neighbor for samples with no points in radius
+        _, idx = tree.query(positions[~nonempty], k=1, workers=-1)
+        sampled_values[~nonempty] = values[idx]
 
     return distances, positions, sampled_values
 
@@ -97,7 +153,10 @@ def save_line_profile_plot(
         distances = distances * nm_per_pixel
         xlabel = xlabel.replace("px", "nm")
 
-    fig, ax = plt.subplots(figsize=(10, 4))
+    # Object-oriented Agg figure: no pyplot figure-manager state to clean up
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
     ax.plot(distances, values, "b-", linewidth=1.5, marker=".", markersize=3, alpha=0.7)
     ax.fill_between(distances, values, alpha=0.2)
@@ -117,8 +176,7 @@ def save_line_profile_plot(
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(path, dpi=300, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DEFAULT_DPI)
 
 
 def save_line_profile_on_image(
@@ -128,10 +186,16 @@ def save_line_profile_on_image(
     path: Path,
     line_color: str = "red",
     linewidth: float = 2,
+    use_matplotlib: bool = False,
 ) -> None:
     """
     Save image with line profile overlay.
 
+    By default the overlay is drawn directly with PIL, which avoids spinning
+    up a matplotlib figure just for a line and two labels (roughly an order
+    of magnitude faster per save). Pass use_matplotlib=True for the
+    figure-based rendering.
+
     Args:
         image: 2D grayscale image.
         start: (x, y) start point.
@@ -139,8 +203,32 @@ def save_line_profile_on_image(
         path: Output file path.
         line_color: Color of the line.
         linewidth: Width of the line.
+        use_matplotlib: Render with matplotlib instead of PIL.
     """
-    fig, ax = plt.subplots(figsize=(8, 8))
+    if not use_matplotlib:
+        from PIL import Image, ImageDraw
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arr = np.subtract(image, np.nanmin(image), dtype=np.float32)
+        peak = np.nanmax(arr)
+        if peak > 0:
+            np.multiply(arr, np.float32(255.0 / peak), out=arr)
+        base = Image.fromarray(arr.astype(np.uint8)).convert("RGB")
+        draw = ImageDraw.Draw(base)
+        width = max(1, int(round(linewidth)))
+        draw.line([tuple(start), tuple(end)], fill=line_color, width=width)
+        marker = width + 3
+        for px, py in (start, end):
+            draw.ellipse((px - marker, py - marker, px + marker, py + marker), fill=line_color)
+        draw.text((start[0] + 8, start[1] + 8), "Start", fill=line_color)
+        draw.text((end[0] + 8, end[1] + 8), "End", fill=line_color)
+        base.save(path)
+        return
+
+    fig = Figure(figsize=(8, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
     ax.imshow(image, cmap="gray")
 
     ax.plot(
@@ -166,8 +254,7 @@ def save_line_profile_on_image(
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(path, dpi=300, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DEFAULT_DPI)
 
 
 def save_line_profile_csv(
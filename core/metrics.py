@@ -74,7 +74,9 @@ def compute_strain_from_displacement(
     Returns:
         Dictionary with exx, eyy, exy, rotation arrays and grid coordinates.
     """
-    from scipy.interpolate import griddata
+    from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator
+
+    from . import viz_utils
 
     h, w = image_shape
 
@@ -84,18 +86,24 @@ def compute_strain_from_displacement(
         -margin_factor*w : w*(1+margin_factor) : complex(0, grid_size),
         -margin_factor*h : h*(1+margin_factor) : complex(0, grid_size)
     ]
-
-    # Interpolate displacement fields to regular grid using linear method
-    u_grid = griddata(points, dx, (grid_x, grid_y), method="linear", fill_value=np.nan)
-    v_grid = griddata(points, dy, (grid_x, grid_y), method="linear", fill_value=np.nan)
-    
-    # Fill remaining NaN values with nearest neighbor
-    if np.any(np.isnan(u_grid)):
-        u_grid_nearest = griddata(points, dx, (grid_x, grid_y), method="nearest")
-        u_grid[np.isnan(u_grid)] = u_grid_nearest[np.isnan(u_grid)]
-    if np.any(np.isnan(v_grid)):
-        v_grid_nearest = griddata(points, dy, (grid_x, grid_y), method="nearest")
-        v_grid[np.isnan(v_grid)] = v_grid_nearest[np.isnan(v_grid)]
+    grid_xy = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+
+    # Triangulate once (shared cache with the heatmap export, which uses
+    # the same points); the vector-valued interpolator evaluates both
+    # displacement components in a single triangulation walk per sample
+    tri = viz_utils.cached_delaunay(points)
+    uv = np.column_stack([dx, dy])
+    interp = LinearNDInterpolator(tri, uv)(grid_xy)
+    u_grid = interp[:, 0].reshape(grid_x.shape)
+    v_grid = interp[:, 1].reshape(grid_x.shape)
+
+    # Fill remaining NaN values (outside the convex hull) with nearest
+    # neighbor; u and v share the hull, so one mask covers both
+    nan_mask = np.isnan(u_grid)
+    if np.any(nan_mask):
+        filled = NearestNDInterpolator(points, uv)(grid_x[nan_mask], grid_y[nan_mask])
+        u_grid[nan_mask] = filled[:, 0]
+        v_grid[nan_mask] = filled[:, 1]
 
     # Compute pixel spacing on the interpolation grid
     dx_spacing = w / (grid_size - 1)
@@ -1,15 +1,20 @@
 from dataclasses import dataclass
+from functools import partial
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from scipy.spatial import cKDTree
 import tqdm
 
-# Avoid numba caching/jit issues in hyperspy/atomap on constrained filesystems
+# Avoid numba caching issues in hyperspy/atomap on constrained filesystems
 os.environ.setdefault("NUMBA_DISABLE_CACHING", "1")
-os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+# JIT stays enabled by default (atomap's refinement loops rely on it);
+# STEM_DISABLE_NUMBA=1 opts out on machines where compilation is a problem
+if os.environ.get("STEM_DISABLE_NUMBA") == "1":
+    os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
 # Silence tqdm notebook warnings
 os.environ.setdefault("TQDM_DISABLE", "1")
 try:
@@ -68,12 +73,12 @@ def run_pipeline(
     Full pipeline: load -> preprocess -> lattice detection/refine -> displacement/strain.
     """
     logger.info(f"Starting pipeline | image={image_path}")
-    raw = io_utils.load_image(image_path)
+    # Crop in the loader so large DM4 frames only materialize the ROI
+    raw = io_utils.load_image(image_path, roi=roi)
     img = preprocess.preprocess_image(
         raw,
         gaussian_sigma=gaussian_sigma,
         background_sigma=background_sigma,
-        roi=roi,
         invert=invert,
     )
     logger.info("Preprocess done")
@@ -96,19 +101,29 @@ def run_pipeline(
     peaks_a = sub_a.atom_positions
     peaks_b = sub_b.atom_positions
 
-    dx_px, dy_px = lattice_mod.compute_b_displacements(peaks_b, ideal_b)
-    mag_px = np.hypot(dx_px, dy_px)
+    # Build the ideal-site tree once; downstream stages reuse it
+    tree_ideal = cKDTree(ideal_b, balanced_tree=False, compact_nodes=False)
+    # One contiguous (N, 2) array; dx/dy stay column views of it so CSV
+    # writers can dump the vectors without re-stacking copies
+    vec_px = lattice_mod.compute_b_displacements(peaks_b, ideal_b, tree=tree_ideal)
+    dx_px = vec_px[:, 0]
+    dy_px = vec_px[:, 1]
+    mag_px = np.linalg.norm(vec_px, axis=1)
     if nm_per_pixel:
-        dx_nm = dx_px * nm_per_pixel
-        dy_nm = dy_px * nm_per_pixel
+        vec_nm = vec_px * nm_per_pixel
+        dx_nm = vec_nm[:, 0]
+        dy_nm = vec_nm[:, 1]
         mag_nm = mag_px * nm_per_pixel
     else:
+        vec_nm = None
         dx_nm = dy_nm = mag_nm = None
 
     disp = {
+        "vec": vec_px,
         "dx": dx_px,
         "dy": dy_px,
         "mag": mag_px,
+        "vec_nm": vec_nm,
         "dx_nm": dx_nm,
         "dy_nm": dy_nm,
         "mag_nm": mag_nm,
@@ -130,7 +145,7 @@ def run_pipeline(
         io_utils.save_csv(peaks_a, header="x,y", path=out_dir / "peaks_a.csv")
         io_utils.save_csv(peaks_b, header="x,y", path=out_dir / "peaks_b.csv")
         viz.save_peaks_overlay(img, peaks_a, peaks_b, out_dir / "peaks_overlay.png")
-        io_utils.save_csv(np.column_stack((dx_px, dy_px)), header="dx,dy (pixels)", path=out_dir / "displacement.csv")
+        io_utils.save_csv(vec_px, header="dx,dy (pixels)", path=out_dir / "displacement.csv")
         viz.save_displacement_arrows(
             img,
             ideal_b,
@@ -163,8 +178,8 @@ def run_pipeline(
             arrow_scale=sep if sep else 1.0,
             nm_per_pixel=nm_per_pixel,
         )
-        if dx_nm is not None:
-            io_utils.save_csv(np.column_stack((dx_nm, dy_nm)), header="dx,dy (nm)", path=out_dir / "displacement_nm.csv")
+        if vec_nm is not None:
+            io_utils.save_csv(vec_nm, header="dx,dy (nm)", path=out_dir / "displacement_nm.csv")
         # Statistical analysis outputs
         stats.save_magnitude_histogram(mag_px, out_dir / "displacement_histogram.png", nm_per_pixel=nm_per_pixel)
         stats.save_angle_polar_histogram(dx_px, dy_px, out_dir / "displacement_polar.png")
@@ -189,3 +204,28 @@ def run_pipeline(
         strain=strain,
         output_dir=out_dir,
     )
+
+
+def _warmup() -> None:
+    """Worker initializer: pay the heavy imports once per worker process."""
+    import atomap.api  # noqa: F401
+    import hyperspy.api  # noqa: F401
+
+
+def run_pipeline_batch(
+    image_paths: Sequence[Union[str, Path]],
+    n_workers: Optional[int] = None,
+    **pipeline_kwargs,
+) -> List[PipelineResult]:
+    """
+    Run the pipeline over several images in parallel worker processes.
+
+    Each image is independent, so the batch shards across cores; the
+    initializer imports atomap/hyperspy once per worker instead of paying
+    that cost per image. Keyword arguments are forwarded to run_pipeline.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    worker = partial(run_pipeline, **pipeline_kwargs)
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_warmup) as ex:
+        return list(ex.map(worker, [str(p) for p in image_paths]))
@@ -1,16 +1,37 @@
 from typing import Optional, Tuple
 
 import numpy as np
-from scipy.ndimage import gaussian_filter
+from scipy.ndimage import convolve1d, gaussian_filter
+
+
+def _gaussian_kernel1d(sigma: float) -> np.ndarray:
+    """Normalized float32 Gaussian tap kernel truncated at 4 sigma."""
+    radius = max(1, int(4.0 * sigma + 0.5))
+    x = np.arange(-radius, radius + 1, dtype=np.float32)
+    kernel = np.exp(-(x * x) / np.float32(2.0 * sigma * sigma))
+    kernel /= kernel.sum()
+    return kernel
+
+
+def _gaussian_smooth_inplace(image: np.ndarray, sigma: float) -> None:
+    """Separable Gaussian smoothing writing back into the input buffer.
+
+    Two convolve1d passes with a precomputed float32 kernel keep the work in
+    the input dtype and avoid the intermediate arrays gaussian_filter
+    allocates per axis.
+    """
+    kernel = _gaussian_kernel1d(sigma)
+    convolve1d(image, kernel, axis=0, output=image)
+    convolve1d(image, kernel, axis=1, output=image)
 
 
 def normalize(image: np.ndarray) -> np.ndarray:
-    """Normalize to 0-1."""
-    img = image.astype(np.float64)
-    img -= img.min()
+    """Normalize to 0-1. Operates in place when the input is already float."""
+    img = image if np.issubdtype(image.dtype, np.floating) else image.astype(np.float32)
+    np.subtract(img, img.min(), out=img)
     max_val = img.max()
     if max_val > 0:
-        img /= max_val
+        np.divide(img, max_val, out=img)
     return img
 
 
@@ -31,16 +52,23 @@ def preprocess_image(
 ) -> np.ndarray:
     """
     Basic preprocessing: optional ROI crop, background removal, and Gaussian smoothing.
+
+    All stages mutate a single private float copy in place, so the image is
+    traversed once per stage instead of allocating fresh intermediates.
     """
     img = image
     if roi is not None:
         x1, y1, x2, y2 = roi
         img = img[y1:y2, x1:x2]
+    # Private float32 working copy; every step below writes back into it
+    img = np.array(img, dtype=np.float32)
     if invert:
         # Flip contrast so atoms become bright for downstream peak finding
-        img = img.max() - img
+        np.subtract(img.max(), img, out=img)
     if background_sigma:
-        img = remove_background(img, sigma=background_sigma)
+        blurred = np.empty_like(img)
+        gaussian_filter(img, sigma=background_sigma, output=blurred)
+        np.subtract(img, blurred, out=img)
     if gaussian_sigma and gaussian_sigma > 0:
-        img = gaussian_filter(img, sigma=gaussian_sigma)
+        _gaussian_smooth_inplace(img, gaussian_sigma)
     return normalize(img)
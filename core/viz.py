@@ -1,49 +1,129 @@
 from pathlib import Path
 from typing import Literal, Optional
 
-import matplotlib
-matplotlib.use("Agg")  # ensure headless backend
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.interpolate import griddata
 
 from . import viz_utils
 
+# Export knobs. 150 dpi is plenty for on-screen review of diagnostic PNGs,
+# and bbox_inches="tight" renders every figure twice — both are opt-in.
+DEFAULT_DPI = 150
+TIGHT_BBOX = False
+
+
+def _savefig(fig, path, **kwargs) -> None:
+    """savefig with the module-level dpi/bbox policy applied."""
+    if TIGHT_BBOX:
+        kwargs.setdefault("bbox_inches", "tight")
+    fig.savefig(path, dpi=DEFAULT_DPI, **kwargs)
+
+
+_FIG_CACHE: dict = {}
+
+
+def _get_fig(figsize: tuple):
+    """
+    Reusable Figure per size. Allocating a fresh figure (and its Agg pixel
+    buffer) per save is a measurable cost when exporting many PNGs; clearing
+    a pooled figure amortizes it.
+
+    Figures are plain matplotlib.figure.Figure objects with an Agg canvas:
+    nothing is registered in pyplot's figure manager, so there is no global
+    state to close and no GUI machinery involved.
+    """
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _FIG_CACHE[figsize] = fig
+    else:
+        fig.clf()
+    return fig
+
 
 def plot_heatmap(array: np.ndarray, title: str = "", cmap: str = "magma", save_path: Optional[Path] = None):
-    fig, ax = plt.subplots(figsize=(5, 4))
+    fig = _get_fig((5, 4))
+    ax = fig.add_subplot()
     im = ax.imshow(array, cmap=cmap)
     ax.set_title(title)
     ax.axis("off")
     fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
     if save_path:
         Path(save_path).parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(save_path, dpi=200, bbox_inches="tight")
-    plt.close(fig)
+        _savefig(fig, save_path)
     return fig
 
 
 def plot_displacement(dx: np.ndarray, dy: np.ndarray, title: str = "Displacement magnitude", cmap: str = "magma", save_path: Optional[Path] = None):
+    # Display precision only: float32 halves the bytes moved per pass
+    dx = np.ascontiguousarray(dx, dtype=np.float32)
+    dy = np.ascontiguousarray(dy, dtype=np.float32)
     mag = np.hypot(dx, dy)
     return plot_heatmap(mag, title=title, cmap=cmap, save_path=save_path)
 
 
+def _abs_percentile(data: np.ndarray, q: float) -> float:
+    """
+    Percentile of |data| ignoring NaNs, via np.partition.
+
+    np.nanpercentile fully sorts a masked copy; a partial sort at the single
+    order statistic we need is O(n) and noticeably faster on strain grids.
+    """
+    absv = np.abs(data[np.isfinite(data)])
+    if absv.size == 0:
+        return 0.0
+    k = min(absv.size - 1, int(q / 100.0 * (absv.size - 1) + 0.5))
+    return float(np.partition(absv, k)[k])
+
+
+def _to_uint8(image: np.ndarray) -> np.ndarray:
+    """Rescale to 0-255 uint8: one min scan, one max scan, one float32 rescale pass."""
+    lo = np.nanmin(image)
+    hi = np.nanmax(image)
+    if hi > lo:
+        buf = np.subtract(image, lo, dtype=np.float32)
+        np.multiply(buf, np.float32(255.0 / (hi - lo)), out=buf)
+        return buf.astype(np.uint8)
+    return np.zeros(image.shape, dtype=np.uint8)
+
+
+def _stamp_rings(rgb: np.ndarray, peaks: np.ndarray, color: tuple, radius: int) -> None:
+    """Scatter a precomputed ring stencil into an RGB uint8 array at each peak."""
+    if len(peaks) == 0:
+        return
+    h, w = rgb.shape[:2]
+    yy, xx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    rr = xx * xx + yy * yy
+    ring = (rr <= radius * radius) & (rr >= (radius - 1) ** 2)
+    dy, dx = np.nonzero(ring)
+    dy -= radius
+    dx -= radius
+    px = np.round(np.asarray(peaks)[:, 0]).astype(np.intp)
+    py = np.round(np.asarray(peaks)[:, 1]).astype(np.intp)
+    ys = py[:, None] + dy[None, :]
+    xs = px[:, None] + dx[None, :]
+    valid = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+    rgb[ys[valid], xs[valid]] = color
+
+
 def save_peaks_overlay(image: np.ndarray, peaks_a: np.ndarray, peaks_b: np.ndarray, path: Path, radius: int = 3):
-    """Save an RGB image with detected peaks marked (A: lime, B: red) using PIL."""
-    from PIL import Image, ImageDraw
+    """Save an RGB image with detected peaks marked (A: lime, B: red).
+
+    Rings are rasterized by scattering a stencil into the RGB buffer with
+    fancy indexing — one vectorized write per sublattice instead of a
+    Python ImageDraw call per peak.
+    """
+    from PIL import Image
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    arr = image - np.nanmin(image)
-    if np.nanmax(arr) > 0:
-        arr = arr / np.nanmax(arr) * 255.0
-    base = Image.fromarray(arr.astype(np.uint8)).convert("RGB")
-    draw = ImageDraw.Draw(base)
-    for x, y in peaks_a:
-        draw.ellipse((x - radius, y - radius, x + radius, y + radius), outline="lime", width=1)
-    for x, y in peaks_b:
-        draw.ellipse((x - radius, y - radius, x + radius, y + radius), outline="red", width=1)
-    base.save(path)
+    rgb = np.repeat(_to_uint8(image)[:, :, None], 3, axis=2)
+    _stamp_rings(rgb, peaks_a, (0, 255, 0), radius)
+    _stamp_rings(rgb, peaks_b, (255, 0, 0), radius)
+    Image.fromarray(rgb).save(path)
 
 
 def save_displacement_arrows(
@@ -57,14 +137,13 @@ def save_displacement_arrows(
     scale_nm_per_px: Optional[float] = None,
 ):
     """Save an image with displacement arrows (base at ideal B positions)."""
-    import matplotlib.pyplot as plt
-
     dx_draw = dx * arrow_scale
     dy_draw = dy * arrow_scale
 
-    plt.figure(figsize=(6, 6))
-    plt.imshow(image, cmap="gray")
-    plt.quiver(
+    fig = _get_fig((6, 6))
+    ax = fig.add_subplot()
+    ax.imshow(image, cmap="gray")
+    ax.quiver(
         base_points[:, 0],
         base_points[:, 1],
         dx_draw,
@@ -77,47 +156,68 @@ def save_displacement_arrows(
         headwidth=3,
     )
     if scale_nm_per_px:
-        plt.title(f"Displacement arrows, scale: {scale_nm_per_px} nm/px, arrow x{arrow_scale:.2f}")
+        ax.set_title(f"Displacement arrows, scale: {scale_nm_per_px} nm/px, arrow x{arrow_scale:.2f}")
     else:
-        plt.title(f"Displacement arrows x{arrow_scale:.2f}")
-    plt.axis("off")
+        ax.set_title(f"Displacement arrows x{arrow_scale:.2f}")
+    ax.axis("off")
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(path, dpi=300, bbox_inches="tight")
-    plt.close()
+    _savefig(fig, path)
 
 
-def save_displacement_heatmap(image: np.ndarray, points: np.ndarray, magnitudes: np.ndarray, path: Path):
-    """Plot interpolated displacement magnitude over grid with convex hull masking."""
-    import matplotlib.pyplot as plt
+def save_displacement_heatmap(
+    image: np.ndarray,
+    points: np.ndarray,
+    magnitudes: np.ndarray,
+    path: Path,
+    grid_size: Optional[int] = None,
+):
+    """Plot interpolated displacement magnitude over grid with convex hull masking.
 
+    grid_size defaults to a resolution matched to the image (capped at 200);
+    finer grids cost interpolation time the saved figure cannot resolve.
+    """
     h, w = image.shape
-    grid_size = 200
-    
+    if grid_size is None:
+        grid_size = min(200, max(64, min(h, w)))
+
+    # Triangulate the incoming points before any cast so the cache entry
+    # matches the strain computation's (same float64 peak positions)
+    tri = viz_utils.cached_delaunay(points)
+
+    # Rendering needs no more than float32; halves interpolation bandwidth
+    points = np.ascontiguousarray(points, dtype=np.float32)
+    magnitudes = np.ascontiguousarray(magnitudes, dtype=np.float32)
+
+    from scipy.interpolate import LinearNDInterpolator
+
     # Create interpolation grid
     grid_x, grid_y = np.mgrid[0:w:complex(0, grid_size), 0:h:complex(0, grid_size)]
-    
-    # Use linear interpolation (no edge filling)
-    grid_mag = griddata(points, magnitudes, (grid_x, grid_y), method="linear", fill_value=np.nan)
-    
-    # Apply convex hull mask with shrink margin to exclude edge artifacts
+
+    # Convex hull mask first (with shrink margin to exclude edge artifacts):
+    # everything outside it would be thrown away, so only interpolate the
+    # inside points over the cached triangulation
     mask = viz_utils.create_convex_hull_mask(
         points,
         grid_shape=(grid_size, grid_size),
         grid_extent=(0, w, 0, h),
         shrink_margin=0.10,  # 10% shrink from convex hull
     )
-    grid_mag[~mask.T] = np.nan  # Transpose to match grid orientation
+    keep = mask.T  # Transpose to match grid orientation
+    grid_mag = np.full((grid_size, grid_size), np.nan, dtype=np.float32)
+    grid_mag[keep] = LinearNDInterpolator(tri, magnitudes)(
+        grid_x[keep], grid_y[keep]
+    )
 
-    plt.figure(figsize=(6, 6))
-    im = plt.imshow(grid_mag.T, origin="lower", cmap="magma", extent=(0, w, 0, h))
-    plt.colorbar(im, label="|displacement| (px)")
-    plt.title("Displacement magnitude heatmap")
-    plt.axis("off")
+    fig = _get_fig((6, 6))
+    ax = fig.add_subplot()
+    im = ax.imshow(grid_mag.T, origin="lower", cmap="magma", extent=(0, w, 0, h))
+    fig.colorbar(im, ax=ax, label="|displacement| (px)")
+    ax.set_title("Displacement magnitude heatmap")
+    ax.axis("off")
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(path, dpi=300, bbox_inches="tight")
-    plt.close()
+    _savefig(fig, path)
 
 
 def save_displacement_arrows_colored(
@@ -145,6 +245,9 @@ def save_displacement_arrows_colored(
         nm_per_pixel: If provided, adds a scale bar.
         cmap: Colormap for magnitude mode (default: magma).
     """
+    # Display precision only: float32 halves the bytes moved per pass
+    dx = np.ascontiguousarray(dx, dtype=np.float32)
+    dy = np.ascontiguousarray(dy, dtype=np.float32)
     dx_draw = dx * arrow_scale
     dy_draw = dy * arrow_scale
 
@@ -156,24 +259,25 @@ def save_displacement_arrows_colored(
         magnitudes = np.hypot(dx, dy)
         colors, mappable = viz_utils.magnitude_to_rgb(magnitudes, cmap=cmap)
 
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig = _get_fig((8, 8))
+    ax = fig.add_subplot()
     ax.imshow(image, cmap="gray")
 
-    # Draw arrows one by one with individual colors
-    for i in range(len(base_points)):
-        ax.quiver(
-            base_points[i, 0],
-            base_points[i, 1],
-            dx_draw[i],
-            dy_draw[i],
-            color=colors[i],
-            angles="xy",
-            scale_units="xy",
-            scale=1,
-            width=0.004,
-            headwidth=3,
-            headlength=4,
-        )
+    # One quiver collection with per-arrow colors; matplotlib accepts an
+    # (N, 3) RGB array, so there is no need for one artist per arrow
+    ax.quiver(
+        base_points[:, 0],
+        base_points[:, 1],
+        dx_draw,
+        dy_draw,
+        color=colors,
+        angles="xy",
+        scale_units="xy",
+        scale=1,
+        width=0.004,
+        headwidth=3,
+        headlength=4,
+    )
 
     # Add legend/colorbar
     if color_mode == "angle":
@@ -194,8 +298,7 @@ def save_displacement_arrows_colored(
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(path, dpi=300, bbox_inches="tight", facecolor="black")
-    plt.close(fig)
+    _savefig(fig, path, facecolor="black")
 
 
 def save_strain_maps(
@@ -236,6 +339,9 @@ def save_strain_maps(
             shrink_margin=0.10,
         )
 
+    # Mask each component and find its symmetric color limit once; both the
+    # per-component figures and the combined 2x2 reuse the prepared arrays
+    prepared = []
     for key, title, cmap in components:
         if key not in strain_data:
             continue
@@ -248,54 +354,55 @@ def save_strain_maps(
         if mask is not None:
             data[~mask] = np.nan
 
-        fig, ax = plt.subplots(figsize=(7, 6))
+        prepared.append((key, title, cmap, data, _abs_percentile(data, 98)))
 
+    # One figure/axes/image/colorbar for all components: only the pixel
+    # data, color limits, colormap and labels change between saves, so the
+    # axes and colorbar scaffolding is built a single time
+    fig = im = cbar = None
+    for key, title, cmap, data, vmax in prepared:
         # Symmetric colormap centered at zero
-        vmax = np.nanpercentile(np.abs(data), 98)
         vmin = -vmax
 
-        im = ax.imshow(
-            data.T,  # Transpose for correct orientation
-            origin="lower",
-            cmap=cmap,
-            vmin=vmin,
-            vmax=vmax,
-            extent=(0, w, 0, h),
-        )
+        if fig is None:
+            fig = _get_fig((7, 6))
+            ax = fig.add_subplot()
+            im = ax.imshow(
+                data.T,  # Transpose for correct orientation
+                origin="lower",
+                cmap=cmap,
+                vmin=vmin,
+                vmax=vmax,
+                extent=(0, w, 0, h),
+            )
+            cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+            ax.axis("off")
+
+            # Add scale bar if available
+            if nm_per_pixel is not None:
+                viz_utils.add_scale_bar(ax, nm_per_pixel, w)
+        else:
+            im.set_data(data.T)
+            im.set_clim(vmin, vmax)
+            im.set_cmap(cmap)
+            cbar.update_normal(im)
 
-        cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
         if key == "rotation_deg":
             cbar.set_label("Rotation (degrees)", fontsize=10)
         else:
             cbar.set_label("Strain (dimensionless)", fontsize=10)
 
         ax.set_title(title, fontsize=14)
-        ax.axis("off")
-
-        # Add scale bar if available
-        if nm_per_pixel is not None:
-            viz_utils.add_scale_bar(ax, nm_per_pixel, w)
 
         out_path = path_prefix.parent / f"{path_prefix.stem}_{key}.png"
-        fig.savefig(out_path, dpi=300, bbox_inches="tight", facecolor="white")
-        plt.close(fig)
+        _savefig(fig, out_path, facecolor="white")
 
     # Combined 2x2 figure
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-    axes = axes.flatten()
-
-    for idx, (key, title, cmap) in enumerate(components):
-        if key not in strain_data:
-            continue
+    fig = _get_fig((12, 10))
+    axes = fig.subplots(2, 2).flatten()
 
-        data = strain_data[key].copy()
+    for idx, (key, title, cmap, data, vmax) in enumerate(prepared):
         ax = axes[idx]
-
-        # Apply mask
-        if mask is not None:
-            data[~mask] = np.nan
-
-        vmax = np.nanpercentile(np.abs(data), 98)
         vmin = -vmax
 
         im = ax.imshow(
@@ -307,6 +414,5 @@ def save_strain_maps(
 
     fig.suptitle("Strain Tensor Analysis", fontsize=16, y=0.98)
     fig.tight_layout()
-    fig.savefig(path_prefix.parent / f"{path_prefix.stem}_combined.png", dpi=300, bbox_inches="tight")
-    plt.close(fig)
+    _savefig(fig, path_prefix.parent / f"{path_prefix.stem}_combined.png")
 
@@ -1,16 +1,60 @@
 """Visualization utility functions for scale bars, colorbars, and color mappings."""
 
+from __future__ import annotations
+
+import hashlib
+import os
 from pathlib import Path
-from typing import Literal, Optional, Tuple
-
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-import matplotlib.patches as mpatches
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
-from matplotlib.cm import ScalarMappable
+from typing import TYPE_CHECKING, Literal, Optional, Tuple
+
 import numpy as np
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.figure import Figure
+
+try:
+    from numba import config as _numba_config, njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None and (
+    _numba_config.DISABLE_JIT or os.environ.get("STEM_DISABLE_NUMBA") == "1"
+):
+    # An interpreted hull test per grid point is slower than the
+    # broadcast NumPy path, so disabled JIT falls back the same way a
+    # missing numba does
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _hull_mask_numba(x_coords, y_coords, hull_pts):
+        """Half-plane point-in-hull test, parallel over grid rows with early exit."""
+        rows = y_coords.shape[0]
+        cols = x_coords.shape[0]
+        n_edges = hull_pts.shape[0]
+        mask = np.empty((rows, cols), dtype=np.bool_)
+        for r in prange(rows):
+            gy = y_coords[r]
+            for c in range(cols):
+                gx = x_coords[c]
+                inside = True
+                for e in range(n_edges):
+                    x0 = hull_pts[e, 0]
+                    y0 = hull_pts[e, 1]
+                    x1 = hull_pts[(e + 1) % n_edges, 0]
+                    y1 = hull_pts[(e + 1) % n_edges, 1]
+                    if (x1 - x0) * (gy - y0) - (y1 - y0) * (gx - x0) < 0.0:
+                        inside = False
+                        break
+                mask[r, c] = inside
+        return mask
+else:
+    _hull_mask_numba = None
+
 
 def angle_to_hsv_rgb(angles: np.ndarray) -> np.ndarray:
     """
@@ -22,16 +66,16 @@ def angle_to_hsv_rgb(angles: np.ndarray) -> np.ndarray:
     Returns:
         RGB array of shape (..., 3) with values in [0, 1].
     """
-    # Normalize angle from [-π, π] to [0, 1] for Hue
-    hue = (angles + np.pi) / (2 * np.pi)
-    hue = np.clip(hue, 0, 1)
+    # Normalize angle from [-π, π] to [0, 6) hue sextants
+    h6 = np.clip((angles + np.pi) / (2 * np.pi), 0, 1) * 6
 
-    # Full saturation and value for vivid colors
-    ones = np.ones_like(hue)
-    hsv = np.stack([hue, ones, ones], axis=-1)
-
-    # Convert HSV to RGB
-    return mcolors.hsv_to_rgb(hsv)
+    # Closed-form hue-only conversion (S=V=1): each channel is a
+    # piecewise-linear function of hue, so the generic HSV converter
+    # and its temporary stacks are unnecessary
+    r = np.clip(np.abs(h6 - 3) - 1, 0, 1)
+    g = np.clip(2 - np.abs(h6 - 2), 0, 1)
+    b = np.clip(2 - np.abs(h6 - 4), 0, 1)
+    return np.stack([r, g, b], axis=-1)
 
 
 def magnitude_to_rgb(
@@ -52,6 +96,10 @@ def magnitude_to_rgb(
     Returns:
         Tuple of (RGB array shape (..., 3), ScalarMappable for colorbar).
     """
+    import matplotlib.colors as mcolors
+    import matplotlib.pyplot as plt
+    from matplotlib.cm import ScalarMappable
+
     if vmin is None:
         vmin = np.nanmin(magnitudes)
     if vmax is None:
@@ -91,6 +139,8 @@ def add_scale_bar(
         font_size: Font size for label.
         box_alpha: Background box transparency.
     """
+    import matplotlib.patches as mpatches
+
     image_width_nm = image_width_px * nm_per_pixel
 
     # Auto-select a nice round bar length (~10-20% of image width)
@@ -152,6 +202,18 @@ def add_scale_bar(
     )
 
 
+def _build_wheel() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build the polar mesh and colors for the angle legend (identical for every figure)."""
+    theta = np.linspace(0, 2 * np.pi, 256)
+    radii = np.linspace(0.5, 1.0, 2)
+    theta_grid, r_grid = np.meshgrid(theta, radii)
+    colors = angle_to_hsv_rgb(theta_grid - np.pi)
+    return theta_grid, r_grid, colors.reshape(-1, 3)
+
+
+_WHEEL_THETA, _WHEEL_R, _WHEEL_COLORS = _build_wheel()
+
+
 def add_angle_colorwheel(
     fig: Figure,
     position: Tuple[float, float, float, float] = (0.85, 0.15, 0.1, 0.1),
@@ -166,15 +228,8 @@ def add_angle_colorwheel(
     ax_wheel = fig.add_axes(position, projection="polar")
     ax_wheel.set_theta_zero_location("E")  # 0° at right (East)
 
-    # Create color wheel
-    theta = np.linspace(0, 2 * np.pi, 256)
-    radii = np.linspace(0.5, 1.0, 2)
-    theta_grid, r_grid = np.meshgrid(theta, radii)
-
-    # Map theta to hue
-    colors = angle_to_hsv_rgb(theta_grid - np.pi)
-
-    ax_wheel.pcolormesh(theta_grid, r_grid, theta_grid, color=colors.reshape(-1, 3), shading="auto")
+    # Wheel mesh/colors are precomputed at import; the legend never changes
+    ax_wheel.pcolormesh(_WHEEL_THETA, _WHEEL_R, _WHEEL_THETA, color=_WHEEL_COLORS, shading="auto")
     ax_wheel.set_yticks([])
     ax_wheel.set_xticks([0, np.pi / 2, np.pi, 3 * np.pi / 2])
     ax_wheel.set_xticklabels(["0°", "90°", "±180°", "-90°"], fontsize=6, color="white")
@@ -182,6 +237,38 @@ def add_angle_colorwheel(
     ax_wheel.set_facecolor("black")
 
 
+_MASK_CACHE: dict = {}
+_MASK_CACHE_SIZE = 8
+
+_GRID_CACHE: dict = {}
+_GRID_CACHE_SIZE = 4
+
+_DELAUNAY_CACHE: dict = {}
+_DELAUNAY_CACHE_SIZE = 4
+
+
+def cached_delaunay(points: np.ndarray):
+    """
+    Delaunay triangulation with a small content-keyed cache.
+
+    The strain computation and the displacement heatmap interpolate from
+    the same peak positions during one run; sharing the triangulation
+    amortizes the O(N log N) build across every field interpolated from it.
+    """
+    from scipy.spatial import Delaunay
+
+    # Canonical float64 so the key does not depend on the caller's dtype
+    pts = np.ascontiguousarray(points, dtype=np.float64)
+    key = (pts.shape, hashlib.blake2b(pts.tobytes(), digest_size=16).digest())
+    tri = _DELAUNAY_CACHE.get(key)
+    if tri is None:
+        tri = Delaunay(pts)
+        if len(_DELAUNAY_CACHE) >= _DELAUNAY_CACHE_SIZE:
+            _DELAUNAY_CACHE.pop(next(iter(_DELAUNAY_CACHE)))
+        _DELAUNAY_CACHE[key] = tri
+    return tri
+
+
 def create_convex_hull_mask(
     points: np.ndarray,
     grid_shape: Tuple[int, int],
@@ -194,6 +281,10 @@ def create_convex_hull_mask(
     This masks out regions outside the convex hull of detected atoms,
     with an optional inward margin to exclude edge artifacts.
 
+    The result is cached on (points content, grid parameters): one export
+    run requests the identical mask for every strain component, so only the
+    first call pays for the hull and the grid test.
+
     Args:
         points: (N, 2) array of (x, y) data point positions.
         grid_shape: (rows, cols) shape of the output mask grid.
@@ -204,7 +295,18 @@ def create_convex_hull_mask(
     Returns:
         Boolean mask array of shape grid_shape. True = inside valid region.
     """
-    from scipy.spatial import ConvexHull, Delaunay
+    from scipy.spatial import ConvexHull
+
+    pts = np.ascontiguousarray(points)
+    key = (
+        hashlib.blake2b(pts.tobytes(), digest_size=16).digest(),
+        tuple(grid_shape),
+        tuple(grid_extent),
+        float(shrink_margin),
+    )
+    cached = _MASK_CACHE.get(key)
+    if cached is not None:
+        return cached
 
     if len(points) < 4:
         # Not enough points for hull, return all True
@@ -228,17 +330,36 @@ def create_convex_hull_mask(
     rows, cols = grid_shape
     x_coords = np.linspace(x_min, x_max, cols)
     y_coords = np.linspace(y_min, y_max, rows)
-    grid_x, grid_y = np.meshgrid(x_coords, y_coords)
-    grid_points = np.column_stack([grid_x.ravel(), grid_y.ravel()])
 
-    # Check which grid points are inside the shrunk hull
-    try:
-        delaunay = Delaunay(hull_points)
-        inside = delaunay.find_simplex(grid_points) >= 0
-    except Exception:
-        return np.ones(grid_shape, dtype=bool)
-
-    mask = inside.reshape(grid_shape)
+    # Point-in-convex-polygon via a half-plane test: the hull vertices are
+    # CCW, so a point is inside iff the cross product against every edge is
+    # non-negative. The numba kernel parallelizes over rows and exits a
+    # point on the first failing edge; the NumPy fallback does one
+    # broadcasted (G, E) pass.
+    if _hull_mask_numba is not None:
+        mask = _hull_mask_numba(
+            x_coords, y_coords, np.ascontiguousarray(hull_points, dtype=np.float64)
+        )
+    else:
+        # The flattened grid depends only on shape and extent, which repeat
+        # across the strain components of one run — keep a few around
+        gkey = (rows, cols, x_min, x_max, y_min, y_max)
+        grid_points = _GRID_CACHE.get(gkey)
+        if grid_points is None:
+            grid_x, grid_y = np.meshgrid(x_coords, y_coords)
+            grid_points = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+            if len(_GRID_CACHE) >= _GRID_CACHE_SIZE:
+                _GRID_CACHE.pop(next(iter(_GRID_CACHE)))
+            _GRID_CACHE[gkey] = grid_points
+        p0 = hull_points
+        edges = np.roll(hull_points, -1, axis=0) - p0
+        gx = grid_points[:, 0][:, None]
+        gy = grid_points[:, 1][:, None]
+        cross = edges[:, 0] * (gy - p0[:, 1]) - edges[:, 1] * (gx - p0[:, 0])
+        mask = np.all(cross >= 0, axis=1).reshape(grid_shape)
+    if len(_MASK_CACHE) >= _MASK_CACHE_SIZE:
+        _MASK_CACHE.pop(next(iter(_MASK_CACHE)))
+    _MASK_CACHE[key] = mask
     return mask
 
 
@@ -4,7 +4,10 @@ matplotlib.use("Agg")  # Force headless
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 # Add project root to path
@@ -12,6 +15,19 @@ sys.path.append(os.getcwd())
 
 from core import pipeline, io_utils
 
+
+@lru_cache(maxsize=4)
+def _load_font(size=24):
+    """Load the title font once per size; truetype() builds a fresh atlas each call."""
+    try:
+        font_path = "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf"
+        if not Path(font_path).exists():
+            font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+        return ImageFont.truetype(font_path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
 def generate_screenshot():
     # 1. Run Pipeline
     image_path = "data/250525 154446 STEM 5.1Mx HAADF c.dm3"  # Use verified existing file
@@ -51,8 +67,11 @@ def generate_screenshot():
         p = out_dir / fname
         if p.exists():
             img = Image.open(p)
-            # Resize preserving aspect ratio to fit in target_size
-            img.thumbnail(target_size, Image.Resampling.LANCZOS)
+            # Shrink-on-load for JPEG sources (a no-op for PNG), then resize
+            # preserving aspect ratio. BICUBIC is visually identical to
+            # LANCZOS for preview thumbnails and noticeably faster.
+            img.draft("RGB", target_size)
+            img.thumbnail(target_size, Image.Resampling.BICUBIC)
             images.append(img)
             titles.append(title)
         else:
@@ -67,46 +86,38 @@ def generate_screenshot():
     # layout: 2x2
     margin = 40
     text_h = 40
+    bg = 0x2b  # Dark theme bg (#2b2b2b is a uniform gray)
     
     # Calculate cell size
     cell_w = max(im.width for im in images) + 2 * margin
     cell_h = max(im.height for im in images) + 2 * margin + text_h
     
-    canvas_w = cell_w * 2
-    canvas_h = cell_h * 2
+    # Assemble the canvas as one numpy array: pad each thumbnail out to a
+    # full cell and let np.block do the 2x2 tiling in a single memcpy-style
+    # pass instead of four Image.paste calls onto a fresh canvas.
+    cells = []
+    for img in images:
+        arr = np.asarray(img.convert("RGB"))
+        left = margin + (cell_w - 2 * margin - img.width) // 2
+        top = margin + text_h  # Top align below the title band
+        cells.append(np.pad(
+            arr,
+            ((top, cell_h - top - img.height), (left, cell_w - left - img.width), (0, 0)),
+            constant_values=bg,
+        ))
+    canvas = np.block([[cells[0], cells[1]], [cells[2], cells[3]]])
     
-    collage = Image.new('RGB', (canvas_w, canvas_h), color='#2b2b2b') # Dark theme bg
+    collage = Image.fromarray(canvas)
     draw = ImageDraw.Draw(collage)
-    
-    # Try to load a font
-    try:
-        font_path = "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf"
-        if not Path(font_path).exists():
-             font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-        font = ImageFont.truetype(font_path, 24)
-    except:
-        font = ImageFont.load_default()
+
+    font = _load_font(24)
+    title_widths = [draw.textlength(title, font=font) for title in titles]
 
     positions = [(0, 0), (1, 0), (0, 1), (1, 1)]
     
-    for idx, (img, title) in enumerate(zip(images, titles)):
+    for idx, title in enumerate(titles):
         r, c = positions[idx]
-        x = c * cell_w + margin
-        y = r * cell_h + margin + text_h
-        
-        # Center image in cell
-        img_x = x + (cell_w - 2 * margin - img.width) // 2
-        img_y = y  # Top align
-        
-        collage.paste(img, (img_x, img_y))
-        
-        # Draw Title
-        try:
-            title_w = draw.textlength(title, font=font)
-        except:
-            title_w = draw.textsize(title, font=font)[0]
-            
-        text_x = c * cell_w + (cell_w - title_w) // 2
+        text_x = c * cell_w + (cell_w - title_widths[idx]) // 2
         text_y = r * cell_h + margin
         draw.text((text_x, text_y), title, fill="white", font=font)
 
@@ -4,16 +4,21 @@ Defaults match the example in ./data for easy IDE execution.
 """
 
 import argparse
+import hashlib
 import os
 from pathlib import Path
 from typing import Optional
 
+# Translate the numba opt-out before hyperspy pulls numba in; core.pipeline
+# does the same, but it is imported too late to matter here
+if os.environ.get("STEM_DISABLE_NUMBA") == "1":
+    os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
 import numpy as np
 import hyperspy.api as hs
-from PIL import Image, ImageDraw
+from PIL import Image
 import tqdm
 import sys
-import matplotlib.pyplot as plt
 
 # Disable tqdm notebook bars to avoid AttributeError when closing
 os.environ.setdefault("TQDM_DISABLE", "1")
@@ -63,21 +68,41 @@ def get_metadata_hints(path: Path) -> tuple[Optional[float], bool]:
     invert = False
     meta_text = ""
     try:
-        sig = hs.load(path, lazy=True)
-        axes = getattr(sig.axes_manager, "signal_axes", sig.axes_manager)
+        # rsciio's reader parses the dm3 tag tree without constructing a
+        # hyperspy signal (no axes manager, no dask array) — much cheaper
+        # when all we want is axis scale/units and the metadata text
+        from rsciio.digital_micrograph import file_reader
+
+        desc = file_reader(str(path), lazy=True)[0]
         nm_vals = []
-        for ax in axes:
+        for ax in desc.get("axes", []):
             # Skip navigation axes if present
-            if getattr(ax, "is_navigator", False):
+            if ax.get("navigate"):
                 continue
-            nm = _to_nm_per_px(getattr(ax, "scale", None), getattr(ax, "units", "") or "")
+            nm = _to_nm_per_px(ax.get("scale"), ax.get("units") or "")
             if nm:
                 nm_vals.append(nm)
         if nm_vals:
             nm_per_px = float(np.mean(nm_vals))
-        meta_text = str(sig.metadata.as_dictionary()).upper()
+        meta_text = str(desc.get("metadata", {})).upper()
     except Exception:
-        meta_text = ""
+        # Non-dm3 inputs or older rsciio: fall back to the hyperspy loader
+        try:
+            sig = hs.load(path, lazy=True)
+            axes = getattr(sig.axes_manager, "signal_axes", sig.axes_manager)
+            nm_vals = []
+            for ax in axes:
+                # Skip navigation axes if present
+                if getattr(ax, "is_navigator", False):
+                    continue
+                nm = _to_nm_per_px(getattr(ax, "scale", None), getattr(ax, "units", "") or "")
+                if nm:
+                    nm_vals.append(nm)
+            if nm_vals:
+                nm_per_px = float(np.mean(nm_vals))
+            meta_text = str(sig.metadata.as_dictionary()).upper()
+        except Exception:
+            meta_text = ""
 
     upper_name = path.name.upper()
     meta_upper = meta_text
@@ -95,20 +120,6 @@ def get_metadata_hints(path: Path) -> tuple[Optional[float], bool]:
     return nm_per_px, invert
 
 
-def save_peaks_overlay(image: np.ndarray, peaks_a: np.ndarray, peaks_b: np.ndarray, path: Path, radius: int = 3):
-    """Save an RGB image with detected peaks marked (A: lime, B: red)."""
-    arr = image - np.nanmin(image)
-    if np.nanmax(arr) > 0:
-        arr = arr / np.nanmax(arr) * 255.0
-    base = Image.fromarray(arr.astype(np.uint8)).convert("RGB")
-    draw = ImageDraw.Draw(base)
-    for x, y in peaks_a:
-        draw.ellipse((x - radius, y - radius, x + radius, y + radius), outline="lime", width=1)
-    for x, y in peaks_b:
-        draw.ellipse((x - radius, y - radius, x + radius, y + radius), outline="red", width=1)
-    base.save(path)
-
-
 def save_displacement_arrows(
     image: np.ndarray,
     base_points: np.ndarray,
@@ -117,15 +128,19 @@ def save_displacement_arrows(
     path: Path,
     scale: Optional[float] = None,
     arrow_scale: Optional[float] = None,
+    dpi: int = 150,
 ):
     """Save an image with displacement arrows (base at ideal B positions, pointing to actual B)."""
     scale_factor = arrow_scale if arrow_scale else 1.0
     dx_draw = dx * scale_factor
     dy_draw = dy * scale_factor
 
-    plt.figure(figsize=(6, 6))
-    plt.imshow(image, cmap="gray")
-    plt.quiver(
+    # Pooled figure: cleared and reused across the per-file loop instead of
+    # paying figure construction/teardown for every image
+    fig = viz._get_fig((6, 6))
+    ax = fig.add_subplot()
+    ax.imshow(image, cmap="gray")
+    q = ax.quiver(
         base_points[:, 0],
         base_points[:, 1],
         dx_draw,
@@ -137,32 +152,73 @@ def save_displacement_arrows(
         width=0.003,
         headwidth=3,
     )
+    # The arrow cloud is the expensive layer; rasterize it at the save dpi
+    q.set_rasterized(True)
     if scale:
-        plt.title(f"Displacement arrows (red), scale: {scale} nm/px")
+        ax.set_title(f"Displacement arrows (red), scale: {scale} nm/px")
     else:
-        plt.title(f"Displacement arrows (green) x{scale_factor:.2f}")
-    plt.axis("off")
+        ax.set_title(f"Displacement arrows (green) x{scale_factor:.2f}")
+    ax.axis("off")
     path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(path, dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=dpi, bbox_inches="tight")
 
 
-def save_displacement_heatmap(image: np.ndarray, points: np.ndarray, magnitudes: np.ndarray, path: Path):
-    """Plot interpolated displacement magnitude over grid (no image overlay)."""
-    from scipy.interpolate import griddata
+def save_displacement_heatmap(
+    image: np.ndarray,
+    points: np.ndarray,
+    magnitudes: np.ndarray,
+    path: Path,
+    separation: Optional[float] = None,
+    dpi: int = 150,
+):
+    """Plot interpolated displacement magnitude over grid (no image overlay).
+
+    The B peaks sit on a near-regular sublattice, so instead of scattered
+    cubic griddata (Delaunay build + Clough-Tocher solve on every call) the
+    magnitudes are bin-averaged onto a lattice-pitch regular grid and
+    upsampled to 200x200 with a separable cubic spline.
+    """
+    from scipy import ndimage
 
     h, w = image.shape
-    grid_x, grid_y = np.mgrid[0:w:200j, 0:h:200j]  # 200x200 grid
-    grid_mag = griddata(points, magnitudes, (grid_x, grid_y), method="cubic", fill_value=np.nan)
-
-    plt.figure(figsize=(6, 6))
-    im = plt.imshow(grid_mag.T, origin="lower", cmap="magma", extent=(0, w, 0, h))
-    plt.colorbar(im, label="|displacement| (px)")
-    plt.title("Displacement magnitude heatmap (interpolated)")
-    plt.axis("off")
+    if separation is None:
+        # Rough pitch estimate: one peak per separation^2 pixels
+        separation = max(1.0, float(np.sqrt(h * w / max(len(points), 1))))
+    nx = int(w / separation) + 1
+    ny = int(h / separation) + 1
+
+    ix = np.clip((points[:, 0] * nx / w).astype(np.intp), 0, nx - 1)
+    iy = np.clip((points[:, 1] * ny / h).astype(np.intp), 0, ny - 1)
+    acc = np.zeros((ny, nx))
+    cnt = np.zeros((ny, nx))
+    np.add.at(acc, (iy, ix), magnitudes)
+    np.add.at(cnt, (iy, ix), 1)
+    filled = cnt > 0
+    grid = np.zeros((ny, nx))
+    if filled.any():
+        grid[filled] = acc[filled] / cnt[filled]
+        # Give empty cells the mean so the spline has no holes to ring around
+        grid[~filled] = grid[filled].mean()
+
+    coords = np.mgrid[0:ny - 1:200j, 0:nx - 1:200j]
+    grid_mag = ndimage.map_coordinates(grid, coords, order=3, mode="nearest")
+    # The mean fill above is spline padding only: upsample the occupancy
+    # mask the same way and blank pixels without measured cells nearby,
+    # matching the NaN fill the scattered interpolation used to produce
+    coverage = ndimage.map_coordinates(
+        filled.astype(np.float64), coords, order=3, mode="nearest"
+    )
+    grid_mag[coverage < 0.5] = np.nan
+
+    fig = viz._get_fig((6, 6))
+    ax = fig.add_subplot()
+    im = ax.imshow(grid_mag, origin="lower", cmap="magma", extent=(0, w, 0, h))
+    im.set_rasterized(True)
+    fig.colorbar(im, ax=ax, label="|displacement| (px)")
+    ax.set_title("Displacement magnitude heatmap (interpolated)")
+    ax.axis("off")
     path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(path, dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.savefig(path, dpi=dpi, bbox_inches="tight")
 
 
 def parse_args():
@@ -175,6 +231,7 @@ def parse_args():
     parser.add_argument("--threshold", type=float, default=None, help="Relative threshold for peak finding.")
     parser.add_argument("--nm-per-pixel", type=float, default=None, help="Scale factor to convert px to nm.")
     parser.add_argument("--arrow-scale", type=float, default=None, help="Scale factor to magnify displacement arrows (px). Default uses lattice separation.")
+    parser.add_argument("--preview-dpi", type=int, default=150, help="DPI for diagnostic PNGs (arrows/heatmap). Use 300 for archival quality.")
     return parser.parse_args()
 
 
@@ -196,77 +253,43 @@ def main():
     out_root.mkdir(parents=True, exist_ok=True)
 
     succeeded, failed = [], []
-    for f in files:
-        out_dir = out_root / f.stem
-        out_dir.mkdir(parents=True, exist_ok=True)
-        print(f"Processing {f} -> {out_dir}")
-
-        auto_nm_per_px, auto_invert = get_metadata_hints(f)
-        nm_per_px = args.nm_per_pixel if args.nm_per_pixel is not None else auto_nm_per_px
-        invert_flag = auto_invert
-
-        # Save raw and inverted preview (to verify automatic inversion on DF-I/BF)
-        try:
-            raw_img = io_utils.load_image(f)
-            io_utils.save_png(raw_img, out_dir / "raw.png")
-            if invert_flag:
-                inv_img = raw_img.max() - raw_img
-                io_utils.save_png(inv_img, out_dir / "raw_inverted.png")
-        except Exception:
-            pass
-
-        try:
-            result = pipeline.run_pipeline(
-                image_path=str(f),
-                gaussian_sigma=args.sigma,
-                background_sigma=None,
-                roi=None,
-                separation=args.separation,
-                threshold=args.threshold,
-                refine_sigma=args.refine_sigma,
-                nm_per_pixel=nm_per_px,
-                invert=invert_flag,
-                output_dir=out_dir,
-            )
-
-            io_utils.save_png(result.image, out_dir / "preprocessed.png")
-            io_utils.save_csv(result.peaks_a, header="x,y", path=out_dir / "peaks_a.csv")
-            io_utils.save_csv(result.peaks_b, header="x,y", path=out_dir / "peaks_b.csv")
-            save_peaks_overlay(result.image, result.peaks_a, result.peaks_b, out_dir / "peaks_overlay.png")
-
-            dx_px = result.displacement["dx"]
-            dy_px = result.displacement["dy"]
-            disp_px = np.column_stack((dx_px, dy_px))
-            io_utils.save_csv(disp_px, header="dx,dy (pixels)", path=out_dir / "displacement.csv")
-            viz.plot_displacement(dx_px.reshape(-1, 1), dy_px.reshape(-1, 1), save_path=out_dir / "displacement.png")
-
-            # Arrow overlay: use ideal B as base, dx/dy as vectors
-            save_displacement_arrows(
-                result.image,
-                result.ideal_b,
-                dx_px,
-                dy_px,
-                out_dir / "displacement_arrows.png",
-                scale=args.nm_per_pixel,
-                arrow_scale=args.arrow_scale or result.separation,
-            )
-
-            # Heatmap of displacement magnitude at B positions
-            mag_px = np.hypot(dx_px, dy_px)
-            save_displacement_heatmap(result.image, result.peaks_b, mag_px, out_dir / "displacement_heatmap.png")
-
-            if result.displacement.get("dx_nm") is not None:
-                dx_nm = result.displacement["dx_nm"]
-                dy_nm = result.displacement["dy_nm"]
-                disp_nm = np.column_stack((dx_nm, dy_nm))
-                io_utils.save_csv(disp_nm, header="dx,dy (nm)", path=out_dir / "displacement_nm.csv")
-
-            succeeded.append(out_dir)
-            print(f"Done: {out_dir.resolve()}")
-        except Exception as exc:
-            failed.append((f, exc))
-            print(f"[WARN] Skip {f}: {exc}")
-            continue
+    if len(files) > 1:
+        # Each file writes its own out_dir, so directory mode fans out over
+        # processes pinned to one BLAS/OpenMP thread each. The env vars must
+        # be set in the parent before the workers start, and the workers must
+        # use the spawn method so their numpy/BLAS loads actually read them —
+        # a forked child inherits thread pools that were sized at library
+        # load, long before any initializer runs.
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
+        os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+        os.environ.setdefault("MKL_NUM_THREADS", "1")
+        with ProcessPoolExecutor(
+            max_workers=min(len(files), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = {pool.submit(_process_one, f, out_root, args): f for f in files}
+            for fut in tqdm.tqdm(as_completed(futures), total=len(futures)):
+                f = futures[fut]
+                try:
+                    out_dir, exc = fut.result()
+                except Exception as exc:  # worker crashed outright
+                    out_dir, exc = out_root / f.stem, exc
+                if exc is None:
+                    succeeded.append(out_dir)
+                else:
+                    failed.append((f, exc))
+                    print(f"[WARN] Skip {f}: {exc}")
+    else:
+        for f in files:
+            out_dir, exc = _process_one(f, out_root, args)
+            if exc is None:
+                succeeded.append(out_dir)
+            else:
+                failed.append((f, exc))
+                print(f"[WARN] Skip {f}: {exc}")
 
     print(f"\nSummary: {len(succeeded)} success, {len(failed)} skipped.")
     if failed:
@@ -274,5 +297,124 @@ def main():
             print(f"  - {f}: {exc}")
 
 
+def _process_one(f: Path, out_root: Path, args) -> tuple[Path, Optional[Exception]]:
+    """Run the full per-file export; returns (out_dir, exception or None)."""
+    out_dir = out_root / f.stem
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Incremental runs: identical input (mtime+size) and identical args
+    # mean identical outputs, so skip files whose cache key still matches
+    st = f.stat()
+    cache_key = hashlib.blake2b(
+        f"{st.st_mtime_ns}:{st.st_size}:{sorted(vars(args).items())}".encode()
+    ).hexdigest()
+    cache_file = out_dir / ".cache"
+    expected = [
+        out_dir / name
+        for name in (
+            "preprocessed.png", "peaks_a.csv", "peaks_b.csv",
+            "peaks_overlay.png", "displacement.csv", "displacement.png",
+            "displacement_arrows.png", "displacement_heatmap.png",
+        )
+    ]
+    if (
+        cache_file.exists()
+        and cache_file.read_text() == cache_key
+        and all(p.exists() for p in expected)
+    ):
+        print(f"Skip {f} (outputs up to date)")
+        return out_dir, None
+    print(f"Processing {f} -> {out_dir}")
+
+    auto_nm_per_px, auto_invert = get_metadata_hints(f)
+    nm_per_px = args.nm_per_pixel if args.nm_per_pixel is not None else auto_nm_per_px
+    invert_flag = auto_invert
+
+    # Save raw and inverted preview (to verify automatic inversion on DF-I/BF).
+    # Previews only need ~1k pixels on a side, so decode/downsample cheaply:
+    # draft() gives libjpeg/libtiff shrink-on-load, dm3 arrays are strided.
+    try:
+        if f.suffix.lower() in {".jpg", ".jpeg", ".tif", ".tiff"}:
+            with Image.open(f) as im:
+                im.draft("L", (1024, 1024))
+                im = im.convert("L")
+                im.thumbnail((1024, 1024), Image.Resampling.BILINEAR)
+                im.save(out_dir / "raw.png")
+                if invert_flag:
+                    arr = np.asarray(im, dtype=np.float32)
+                    io_utils.save_png(arr.max() - arr, out_dir / "raw_inverted.png")
+        else:
+            raw_img = io_utils.load_image(f)
+            k = max(1, max(raw_img.shape) // 1024)
+            preview = raw_img[::k, ::k]
+            io_utils.save_png(preview, out_dir / "raw.png")
+            if invert_flag:
+                io_utils.save_png(preview.max() - preview, out_dir / "raw_inverted.png")
+    except Exception:
+        pass
+
+    try:
+        result = pipeline.run_pipeline(
+            image_path=str(f),
+            gaussian_sigma=args.sigma,
+            background_sigma=None,
+            roi=None,
+            separation=args.separation,
+            threshold=args.threshold,
+            refine_sigma=args.refine_sigma,
+            nm_per_pixel=nm_per_px,
+            invert=invert_flag,
+            output_dir=out_dir,
+        )
+
+        io_utils.save_png(result.image, out_dir / "preprocessed.png")
+        # CSV stays the human-readable artifact; the .npy twin is what
+        # downstream tooling should reload
+        io_utils.save_csv(result.peaks_a, header="x,y", path=out_dir / "peaks_a.csv")
+        io_utils.save_npy(result.peaks_a, out_dir / "peaks_a.npy")
+        io_utils.save_csv(result.peaks_b, header="x,y", path=out_dir / "peaks_b.csv")
+        io_utils.save_npy(result.peaks_b, out_dir / "peaks_b.npy")
+        # Vectorized ring stamping in core.viz replaces the old per-peak ImageDraw loop
+        viz.save_peaks_overlay(result.image, result.peaks_a, result.peaks_b, out_dir / "peaks_overlay.png")
+
+        vec_px = result.displacement["vec"]
+        dx_px = result.displacement["dx"]
+        dy_px = result.displacement["dy"]
+        io_utils.save_csv(vec_px, header="dx,dy (pixels)", path=out_dir / "displacement.csv")
+        io_utils.save_npy(vec_px, out_dir / "displacement.npy")
+        viz.plot_displacement(dx_px.reshape(-1, 1), dy_px.reshape(-1, 1), save_path=out_dir / "displacement.png")
+
+        # Arrow overlay: use ideal B as base, dx/dy as vectors
+        save_displacement_arrows(
+            result.image,
+            result.ideal_b,
+            dx_px,
+            dy_px,
+            out_dir / "displacement_arrows.png",
+            scale=args.nm_per_pixel,
+            arrow_scale=args.arrow_scale or result.separation,
+            dpi=args.preview_dpi,
+        )
+
+        # Heatmap of displacement magnitude at B positions
+        mag_px = result.displacement["mag"]
+        save_displacement_heatmap(
+            result.image, result.peaks_b, mag_px,
+            out_dir / "displacement_heatmap.png",
+            separation=result.separation,
+            dpi=args.preview_dpi,
+        )
+
+        if result.displacement.get("vec_nm") is not None:
+            io_utils.save_csv(result.displacement["vec_nm"], header="dx,dy (nm)", path=out_dir / "displacement_nm.csv")
+            io_utils.save_npy(result.displacement["vec_nm"], out_dir / "displacement_nm.npy")
+
+        cache_file.write_text(cache_key)
+        print(f"Done: {out_dir.resolve()}")
+        return out_dir, None
+    except Exception as exc:
+        return out_dir, exc
+
+
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 import logging
@@ -10,39 +11,166 @@ from config import DEFAULTS
 from core import pipeline
 from core import viz
 from core import io_utils
+from core import _fast
+
+
+def _prefetch(paths) -> None:
+    """Hint the kernel to page in files before the decoders touch them."""
+    if not hasattr(os, "posix_fadvise"):
+        # Windows fallback: a small reader thread warms the cache
+        import threading
+
+        def _touch():
+            for p in paths:
+                try:
+                    with open(p, "rb") as fh:
+                        fh.read(4096)
+                except OSError:
+                    pass
+
+        threading.Thread(target=_touch, daemon=True).start()
+        return
+    for p in paths:
+        try:
+            fd = os.open(str(p), os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
 
+@dataclass(frozen=True)
+class PipelineParams:
+    """Validated run parameters, parsed once per click and passed whole."""
 
-class Worker(QtCore.QObject):
+    gs: float
+    refine_sigma: float
+    sep: Optional[float]
+    thr: Optional[float]
+    nm_per_px: Optional[float]
+    output_dir: Optional[Path]
+
+
+class _PipelineSignals(QtCore.QObject):
     finished = QtCore.Signal(object, object)  # result, error
 
-    def __init__(self, image_path: str, gs: float, refine_sigma: float, sep: Optional[float], thr: Optional[float], output_dir: Optional[Path]):
+
+class PipelineRunnable(QtCore.QRunnable):
+    """Run the analysis pipeline on the global thread pool."""
+
+    def __init__(self, image_path: str, params: PipelineParams, signals: _PipelineSignals):
         super().__init__()
         self.image_path = image_path
-        self.gs = gs
-        self.refine_sigma = refine_sigma
-        self.sep = sep
-        self.thr = thr
-        self.output_dir = output_dir
+        self.params = params
+        self.signals = signals
 
-    @QtCore.Slot()
     def run(self):
+        p = self.params
         try:
             result = pipeline.run_pipeline(
                 self.image_path,
-                gaussian_sigma=self.gs,
+                gaussian_sigma=p.gs,
                 background_sigma=None,
                 roi=None,
-                separation=self.sep,
-                threshold=self.thr,
-                refine_sigma=self.refine_sigma,
-                nm_per_pixel=getattr(self, "nm_per_px", None),
-                output_dir=str(self.output_dir) if self.output_dir else None,
+                separation=p.sep,
+                threshold=p.thr,
+                refine_sigma=p.refine_sigma,
+                nm_per_pixel=p.nm_per_px,
+                output_dir=str(p.output_dir) if p.output_dir else None,
             )
-            self.finished.emit(result, None)
+            self.signals.finished.emit(result, None)
         except Exception as exc:  # pragma: no cover - GUI path
-            self.finished.emit(None, exc)
+            self.signals.finished.emit(None, exc)
+
+
 
 
+class _LoaderSignals(QtCore.QObject):
+    loaded = QtCore.Signal(object, object)  # QImage, target label
+
+
+class PixmapLoader(QtCore.QRunnable):
+    """Decode an image file off the GUI thread.
+
+    QPixmap construction is GUI-thread-only, so the worker decodes to a
+    QImage and the connected slot performs the pixmap conversion.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        label,
+        signals: _LoaderSignals,
+        target: QtCore.QSize,
+        thumb: Optional[Path] = None,
+    ):
+        super().__init__()
+        self.path = path
+        self.label = label
+        self.signals = signals
+        # Captured on the GUI thread at submit time; widgets must not be
+        # touched from the worker
+        self.target = target
+        self.thumb = thumb
+
+    def run(self):
+        reader = QtGui.QImageReader(str(self.path))
+        reader.setAutoTransform(True)
+        src = reader.size()
+        scaled = QtCore.QSize()
+        if src.isValid() and self.target.isValid() and not self.target.isEmpty():
+            scaled = src.scaled(self.target, QtCore.Qt.KeepAspectRatio)
+        if (
+            self.thumb is not None
+            and self.thumb.exists()
+            and self.thumb.stat().st_mtime >= self.path.stat().st_mtime
+        ):
+            # Serve the cached display-size JPEG instead of re-decoding the
+            # full-resolution plot — but only when it is at least as large
+            # as this request's target, so a thumb written for a smaller
+            # label cannot pin every later (bigger) view to a blurry image
+            tsize = QtGui.QImageReader(str(self.thumb)).size()
+            if (
+                scaled.isValid()
+                and tsize.width() >= scaled.width()
+                and tsize.height() >= scaled.height()
+            ):
+                self.signals.loaded.emit(QtGui.QImage(str(self.thumb)), self.label)
+                return
+        # Ask the decoder for an already-downscaled image: libpng then
+        # produces ~label-size pixels instead of the full-res plot
+        if scaled.isValid() and scaled.width() < src.width():
+            reader.setScaledSize(scaled)
+        img = reader.read()
+        if self.thumb is not None and not img.isNull():
+            try:
+                self.thumb.parent.mkdir(parents=True, exist_ok=True)
+                img.save(str(self.thumb), "JPG", 85)
+            except OSError:  # pragma: no cover - read-only output dir
+                pass
+        self.signals.loaded.emit(img, self.label)
+
+
+class _ImageLoadSignals(QtCore.QObject):
+    loaded = QtCore.Signal(object, object)  # array, error
+
+
+class ImageLoadRunnable(QtCore.QRunnable):
+    """Read an input image (DM3/DM4/TIFF/...) off the GUI thread."""
+
+    def __init__(self, path: str, signals: _ImageLoadSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        try:
+            img = io_utils.load_image(self.path)
+            self.signals.loaded.emit(img, None)
+        except Exception as exc:  # pragma: no cover - GUI path
+            self.signals.loaded.emit(None, exc)
 
 
 class ScalableImageLabel(QtWidgets.QLabel):
@@ -52,33 +180,61 @@ class ScalableImageLabel(QtWidgets.QLabel):
         super().__init__(text, parent)
         self.setAlignment(QtCore.Qt.AlignCenter)
         self._pixmap = None
+        # Memoized resample: the smooth rescale only reruns when the
+        # widget size or the source pixmap actually changes
+        self._scaled_cache: Optional[QtGui.QPixmap] = None
+        self._cached_for: tuple = ()
+        self._resizing = False
         # Ignore size policy so the widget doesn't force resize based on content
         self.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Ignored)
 
     def setPixmap(self, pixmap):
         """Store pixmap and trigger repaint without layout recursion."""
         self._pixmap = pixmap
+        self._scaled_cache = None
+        self._cached_for = ()
         # Clear text if any (standard QLabel behavior)
         if pixmap and not pixmap.isNull():
             self.setText("")
         self.update()
 
+    def resizeEvent(self, event):
+        self._scaled_cache = None
+        self._cached_for = ()
+        # Paint cheap nearest-neighbour frames while the user is actively
+        # resizing; the smooth rescale runs once the geometry settles
+        self._resizing = True
+        QtCore.QTimer.singleShot(150, self._end_resize)
+        super().resizeEvent(event)
+
+    def _end_resize(self):
+        self._resizing = False
+        self.update()
+
     def paintEvent(self, event):
         """Custom paint event to draw scaled pixmap."""
         if self._pixmap and not self._pixmap.isNull():
-            painter = QtGui.QPainter(self)
-            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
-            
-            # Calculate target rect to center image while keeping aspect ratio
             rect = self.rect()
-            scaled_size = self._pixmap.size().scaled(rect.size(), QtCore.Qt.KeepAspectRatio)
-            
-            # Center coordinates
-            x = (rect.width() - scaled_size.width()) // 2
-            y = (rect.height() - scaled_size.height()) // 2
-            
-            target_rect = QtCore.QRect(x, y, scaled_size.width(), scaled_size.height())
-            painter.drawPixmap(target_rect, self._pixmap)
+            if self._resizing:
+                scaled_size = self._pixmap.size().scaled(rect.size(), QtCore.Qt.KeepAspectRatio)
+                shown = self._pixmap.scaled(
+                    scaled_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation
+                )
+            else:
+                key = (rect.width(), rect.height(), self._pixmap.cacheKey())
+                if key != self._cached_for:
+                    scaled_size = self._pixmap.size().scaled(rect.size(), QtCore.Qt.KeepAspectRatio)
+                    self._scaled_cache = self._pixmap.scaled(
+                        scaled_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+                    )
+                    self._cached_for = key
+                shown = self._scaled_cache
+
+            # Center the pre-scaled pixmap; plain drawPixmap is a direct blit
+            x = (rect.width() - shown.width()) // 2
+            y = (rect.height() - shown.height()) // 2
+            painter = QtGui.QPainter(self)
+            painter.drawPixmap(x, y, shown)
         else:
             # Fallback to standard paint (e.g. for text)
             super().paintEvent(event)
@@ -93,9 +249,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.image_path: Optional[str] = None
         self.result = None
-        self.thread: Optional[QtCore.QThread] = None
         self.output_dir: Optional[Path] = None
         self.logger = logging.getLogger("stem_atomap")
+        # Display buffer pool for _show_array: (h, w) -> (uint8 buffer,
+        # QImage wrapping it, QPixmap). The ndarray ref keeps the QImage's
+        # memory alive; entries are overwritten in place on every refresh.
+        self._img_pool: dict = {}
+        self._f32_buf: Optional[np.ndarray] = None
+        # Per-label identity of the last displayed content, so re-showing
+        # the same array / file skips the normalize-upload or decode.
+        # Entries are (key, pinned object): arrays are kept alive so their
+        # buffer address cannot be recycled by a later allocation.
+        self._last_shown: dict = {}
+        # Cross-thread delivery of decoded overlay images (queued because
+        # the signals object lives on the GUI thread)
+        self._loader_signals = _LoaderSignals()
+        self._loader_signals.loaded.connect(self._set_pixmap)
+        self._image_signals = _ImageLoadSignals()
+        self._image_signals.loaded.connect(self._on_image_loaded)
+        self._pipeline_signals = _PipelineSignals()
+        self._pipeline_signals.finished.connect(self._on_finished)
+        _fast.warmup()
 
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
@@ -222,9 +396,24 @@ class MainWindow(QtWidgets.QMainWindow):
         if path:
             self.image_path = path
             self.status.setText(f"Selected: {path}")
-            self.statusBar().showMessage("Image selected, ready to run")
-            img = io_utils.load_image(path)
-            self._show_array(img, self.preview_label)
+            self.statusBar().showMessage("Loading preview...")
+            # Large DM3/DM4 reads can take seconds; keep the event loop
+            # alive and show a busy cursor until the preview arrives
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            QtCore.QThreadPool.globalInstance().start(
+                ImageLoadRunnable(path, self._image_signals)
+            )
+
+    @QtCore.Slot(object, object)
+    def _on_image_loaded(self, img, error):
+        QtWidgets.QApplication.restoreOverrideCursor()
+        if error:
+            self.statusBar().showMessage("Failed to load image")
+            self.logger.error(f"Image load failed: {error}")
+            QtWidgets.QMessageBox.critical(self, "Error", str(error))
+            return
+        self.statusBar().showMessage("Image selected, ready to run")
+        self._show_array(img, self.preview_label)
 
     def run_pipeline(self):
         if not self.image_path:
@@ -244,17 +433,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.statusBar().showMessage("Running...")
         self.btn_run.setEnabled(False)
 
-        # Worker thread
-        self.thread = QtCore.QThread()
-        self.worker = Worker(self.image_path, gs, rs, sep, thr, self.output_dir)
-        self.worker.nm_per_px = scale
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self._on_finished)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker.finished.connect(self.thread.quit)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.start()
+        params = PipelineParams(
+            gs=gs, refine_sigma=rs, sep=sep, thr=thr,
+            nm_per_px=scale, output_dir=self.output_dir,
+        )
+
+        QtCore.QThreadPool.globalInstance().start(
+            PipelineRunnable(self.image_path, params, self._pipeline_signals)
+        )
 
     @QtCore.Slot(object, object)
     def _on_finished(self, result, error):
@@ -269,39 +455,118 @@ class MainWindow(QtWidgets.QMainWindow):
         self.output_dir = result.output_dir
         self.status.setText(f"Done | Separation: {self.result.separation:.2f}px")
         self.statusBar().showMessage(f"Done. Output dir: {self.output_dir}")
-        self._show_array(self.result.image, self.preview_label)
 
-        # Tab 1: Overview - Load saved overlays
-        self._load_pixmap(self.output_dir / "peaks_overlay.png", self.overlay_label)
-        self._load_pixmap(self.output_dir / "displacement_arrows.png", self.arrows_label)
-        self._load_pixmap(self.output_dir / "displacement_heatmap.png", self.heatmap_label)
+        # Tab 1: Overview
+        overview = [
+            ("peaks_overlay.png", self.overlay_label),
+            ("displacement_arrows.png", self.arrows_label),
+            ("displacement_heatmap.png", self.heatmap_label),
+        ]
+        secondary = [
+            # Tab 2: Color-coded vectors
+            ("displacement_arrows_angle.png", self.angle_arrows_label),
+            ("displacement_arrows_magnitude.png", self.mag_arrows_label),
+            # Tab 3: Statistics
+            ("displacement_histogram.png", self.histogram_label),
+            ("displacement_polar.png", self.polar_label),
+            # Tab 4: Strain
+            ("strain_combined.png", self.strain_combined_label),
+        ]
+        # Warm the page cache for every overlay while the preview updates
+        _prefetch([self.output_dir / name for name, _ in overview + secondary])
 
-        # Tab 2: Color-coded vectors
-        self._load_pixmap(self.output_dir / "displacement_arrows_angle.png", self.angle_arrows_label)
-        self._load_pixmap(self.output_dir / "displacement_arrows_magnitude.png", self.mag_arrows_label)
+        self._show_array(self.result.image, self.preview_label)
+        for name, label in overview:
+            self._load_pixmap(self.output_dir / name, label)
 
-        # Tab 3: Statistics
-        self._load_pixmap(self.output_dir / "displacement_histogram.png", self.histogram_label)
-        self._load_pixmap(self.output_dir / "displacement_polar.png", self.polar_label)
+        # Queue the hidden tabs' overlays behind the overview paint on the
+        # event loop; the decodes themselves still run off-thread
+        def _load_secondary():
+            for name, label in secondary:
+                self._load_pixmap(self.output_dir / name, label)
 
-        # Tab 4: Strain
-        self._load_pixmap(self.output_dir / "strain_combined.png", self.strain_combined_label)
+        QtCore.QTimer.singleShot(0, _load_secondary)
 
     def _show_array(self, array: np.ndarray, label: ScalableImageLabel):
         """Display numpy array in QLabel with auto-scaling."""
-        arr = array - np.nanmin(array)
-        max_val = np.nanmax(arr)
-        if max_val > 0:
-            arr = arr / max_val * 255.0
-        img = QtGui.QImage(arr.astype(np.uint8), arr.shape[1], arr.shape[0], arr.shape[1], QtGui.QImage.Format_Grayscale8)
-        pixmap = QtGui.QPixmap.fromImage(img)
+        shown_key = (array.ctypes.data, array.shape, str(array.dtype))
+        prev = self._last_shown.get(label)
+        if prev is not None and prev[0] == shown_key:
+            return
+        h, w = array.shape
+        entry = self._img_pool.pop((h, w), None)
+        if entry is None:
+            # buf stays referenced by the pool entry for as long as the
+            # QImage wrapping it lives, so the zero-copy constructor is
+            # safe; bytesPerLine comes from the actual row stride
+            buf = np.ascontiguousarray(np.empty((h, w), dtype=np.uint8))
+            entry = (
+                buf,
+                QtGui.QImage(buf.data, w, h, buf.strides[0], QtGui.QImage.Format_Grayscale8),
+                QtGui.QPixmap(w, h),
+            )
+            if len(self._img_pool) >= 4:
+                self._img_pool.pop(next(iter(self._img_pool)))
+        self._img_pool[(h, w)] = entry  # re-insert as most recent
+        buf, img, pixmap = entry
+        if array.dtype in (np.uint8, np.uint16):
+            # Integer frames (common for TIFF/DM3) never need float math:
+            # normalize through a small lookup table so every full-size
+            # temporary stays on 1-2 byte integer types
+            mn = int(array.min())
+            mx = int(array.max())
+            if mx > mn:
+                lut = ((np.arange(mx - mn + 1, dtype=np.uint32) * 255) // (mx - mn)).astype(np.uint8)
+                np.take(lut, array - mn, out=buf)
+            else:
+                buf.fill(0)
+        elif _fast.norm_u8 is not None and array.dtype in (np.float32, np.float64):
+            _fast.norm_u8(np.ascontiguousarray(array), buf)
+        else:
+            # Single min/max scan, then normalize in place through a reusable
+            # scratch buffer instead of three full-size float temporaries
+            if self._f32_buf is None or self._f32_buf.shape != (h, w):
+                self._f32_buf = np.empty((h, w), dtype=np.float32)
+            mn = float(np.nanmin(array))
+            mx = float(np.nanmax(array))
+            scale = 255.0 / (mx - mn) if mx > mn else 0.0
+            np.subtract(array, np.float32(mn), out=self._f32_buf, dtype=np.float32)
+            np.multiply(self._f32_buf, np.float32(scale), out=self._f32_buf)
+            np.copyto(buf, self._f32_buf, casting="unsafe")
+        # convertFromImage can reuse the pooled pixmap's storage when the
+        # size is unchanged, unlike fromImage which always allocates
+        pixmap.convertFromImage(img)
         label.setPixmap(pixmap)
+        self._last_shown[label] = (shown_key, array)
 
     def _load_pixmap(self, path: Path, label: ScalableImageLabel):
-        """Load image from file into QLabel with auto-scaling."""
+        """Decode an overlay image off-thread and display it when ready."""
         if path and path.exists():
-            pixmap = QtGui.QPixmap(str(path))
-            label.setPixmap(pixmap)
+            shown_key = (str(path), path.stat().st_mtime_ns)
+            prev = self._last_shown.get(label)
+            if prev is not None and prev[0] == shown_key:
+                return
+            self._last_shown[label] = (shown_key, None)
+            thumb = path.parent / "_thumbs" / f"{path.stem}.jpg"
+            # Labels on tabs that were never shown have not been laid out
+            # and report the default child size; floor the decode target at
+            # the tab widget's size so those overlays still decode at a
+            # resolution that fills the tab once it is opened
+            target = label.size()
+            if not label.isVisible():
+                target = target.expandedTo(self.tab_widget.size())
+            QtCore.QThreadPool.globalInstance().start(
+                PixmapLoader(path, label, self._loader_signals, target, thumb)
+            )
+
+    @QtCore.Slot(object, object)
+    def _set_pixmap(self, image: QtGui.QImage, label: ScalableImageLabel):
+        if image.isNull():
+            # Failed decode (e.g. a read racing a rewrite): forget the
+            # submit-time key so the next load request retries this file
+            self._last_shown.pop(label, None)
+            return
+        label.setPixmap(QtGui.QPixmap.fromImage(image))
 
     def export_results(self):
         if not self.result: